@@ -1,3 +1,4 @@
+import functools
 from typing import Any
 
 from fastapi import Depends, HTTPException, Request
@@ -26,6 +27,8 @@ async def get_user_db(session: AsyncSessionDependency):
     yield SQLAlchemyUserDatabase(session, User)
 
 
+# JWTStrategy不持有请求相关状态，每次认证复用同一个实例
+@functools.lru_cache(maxsize=1)
 def get_jwt_strategy() -> JWTStrategy:
     return JWTStrategy(
         secret=app_settings.secret_key, lifetime_seconds=COOKIE_MAX_AGE
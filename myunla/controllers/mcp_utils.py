@@ -27,6 +27,8 @@ async def check_mcp_tenant_permission(
     if not tenant_prefix.startswith("/"):
         tenant_prefix = "/" + tenant_prefix
 
+    tenant_prefix_slash = tenant_prefix + "/"
+
     logger.debug(f"租户前缀: {tenant_prefix}")
     logger.debug(f"配置路由数量: {len(cfg.routers)}")
 
@@ -35,7 +37,7 @@ async def check_mcp_tenant_permission(
         if router.prefix == tenant_prefix:
             logger.debug(f"路由 {i} 匹配租户前缀")
             continue
-        if not router.prefix.startswith(tenant_prefix + "/"):
+        if not router.prefix.startswith(tenant_prefix_slash):
             logger.warning(
                 f"权限检查失败 - 路由前缀不匹配: router.prefix={router.prefix}, tenant_prefix={tenant_prefix}"
             )
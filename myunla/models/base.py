@@ -1,4 +1,4 @@
-import uuid
+import secrets
 from enum import Enum
 
 from sqlalchemy import Enum as SQLColumn
@@ -10,8 +10,8 @@ class Base(DeclarativeBase):
 
 
 def random_id():
-    """Generate a secure random ID using UUID4."""
-    return uuid.uuid4().hex[:16]
+    """Generate a secure random 16-character hex ID."""
+    return secrets.token_hex(8)
 
 
 def EnumColumn(enum_class: type[Enum], **kwargs):
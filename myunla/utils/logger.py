@@ -1,7 +1,48 @@
+import json
 import logging
+import logging.handlers
+import os
 import sys
+import time
 from typing import Optional
 
+# 日志缓冲配置：缓冲条数（默认0即不缓冲，批处理脚本可按需开启）
+# 和立即刷新的级别；长期运行的服务没有定时刷新，不应开启缓冲
+_LOG_BUFFER = int(os.getenv("LOG_BUFFER", "0"))
+_LOG_FLUSH_LEVEL = logging.getLevelNamesMapping().get(
+    os.getenv("LOG_FLUSH_LEVEL", "WARNING").upper(), logging.WARNING
+)
+
+# 标准的logging属性，不作为extra信息输出
+_STANDARD_ATTRS = frozenset(
+    {
+        'name',
+        'msg',
+        'args',
+        'levelname',
+        'levelno',
+        'pathname',
+        'filename',
+        'module',
+        'exc_info',
+        'exc_text',
+        'stack_info',
+        'lineno',
+        'funcName',
+        'created',
+        'msecs',
+        'relativeCreated',
+        'thread',
+        'threadName',
+        'processName',
+        'process',
+        'getMessage',
+        'message',
+        'asctime',
+        'taskName',
+    }
+)
+
 
 class ExtraInfoFormatter(logging.Formatter):
     """支持extra信息的自定义格式器"""
@@ -12,59 +53,46 @@ class ExtraInfoFormatter(logging.Formatter):
         self.base_format = (
             fmt or '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
+        self._sep = " | "
+        # 缓存同一秒内的时间字符串: (秒, 格式化结果)
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record, datefmt=None):
+        """格式化时间，同一秒内的记录复用已格式化的时间前缀"""
+        datefmt = datefmt or self.datefmt
+        sec = int(record.created)
+        cached_sec, cached_str = self._time_cache
+        if sec != cached_sec:
+            cached_str = time.strftime(
+                datefmt or self.default_time_format, self.converter(sec)
+            )
+            self._time_cache = (sec, cached_str)
+        if datefmt:
+            return cached_str
+        return self.default_msec_format % (cached_str, record.msecs)
 
     def format(self, record):
         # 首先使用基础格式
         formatted = super().format(record)
 
-        # 收集extra信息（排除标准的logging属性）
-        standard_attrs = {
-            'name',
-            'msg',
-            'args',
-            'levelname',
-            'levelno',
-            'pathname',
-            'filename',
-            'module',
-            'exc_info',
-            'exc_text',
-            'stack_info',
-            'lineno',
-            'funcName',
-            'created',
-            'msecs',
-            'relativeCreated',
-            'thread',
-            'threadName',
-            'processName',
-            'process',
-            'getMessage',
-            'message',
-            'asctime',
-        }
-
-        extra_items = []
+        # 收集extra信息（排除标准的logging属性），一次性拼接
+        parts = [formatted]
         for key, value in record.__dict__.items():
-            if key not in standard_attrs and not key.startswith('_'):
-                # 格式化value，确保它是字符串
-                if isinstance(value, (dict, list)):
-                    import json
-
-                    try:
-                        formatted_value = json.dumps(value, ensure_ascii=False)
-                    except (TypeError, ValueError):
-                        formatted_value = str(value)
-                else:
-                    formatted_value = str(value)
-                extra_items.append(f"{key}={formatted_value}")
+            if key in _STANDARD_ATTRS or key.startswith('_'):
+                continue
+            # 格式化value，确保它是字符串
+            if isinstance(value, (dict, list)):
+                try:
+                    value = json.dumps(value, ensure_ascii=False)
+                except (TypeError, ValueError):
+                    pass
+            parts.append(self._sep)
+            parts.append(f"{key}={value}")
 
         # 如果有extra信息，追加到日志消息中
-        if extra_items:
-            extra_str = " | ".join(extra_items)
-            formatted += f" | {extra_str}"
-
-        return formatted
+        if len(parts) == 1:
+            return formatted
+        return "".join(parts)
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -81,8 +109,18 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
 
+        # 设置LOG_BUFFER后批量写入控制台，减少每条日志一次的write系统调用；
+        # 退出时由logging.shutdown负责刷新剩余的缓冲记录
+        handler: logging.Handler = console_handler
+        if _LOG_BUFFER > 0:
+            handler = logging.handlers.MemoryHandler(
+                capacity=_LOG_BUFFER,
+                flushLevel=_LOG_FLUSH_LEVEL,
+                target=console_handler,
+            )
+
         # 添加处理器到logger
-        logger.addHandler(console_handler)
+        logger.addHandler(handler)
         logger.setLevel(logging.INFO)
 
     return logger
@@ -1,8 +1,21 @@
 """Redis工具函数"""
 
+import functools
 import re
 
 
+@functools.lru_cache(maxsize=64)
+def _translate_table(delimiters: tuple[str, ...]) -> dict[int, str]:
+    """构建将所有单字符分隔符统一为第一个分隔符的转换表"""
+    return str.maketrans(dict.fromkeys(delimiters, delimiters[0]))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(delimiters: tuple[str, ...]) -> re.Pattern[str]:
+    """编译匹配任一分隔符的正则表达式，转义特殊字符"""
+    return re.compile("|".join(re.escape(d) for d in delimiters))
+
+
 def split_by_multiple_delimiters(text: str, *delimiters: str) -> list[str]:
     """
     按多个分隔符分割字符串
@@ -17,9 +30,13 @@ def split_by_multiple_delimiters(text: str, *delimiters: str) -> list[str]:
     if not text:
         return []
 
-    # 创建正则表达式模式，转义特殊字符
-    escaped_delimiters = [re.escape(d) for d in delimiters]
-    pattern = "|".join(escaped_delimiters)
+    # 分隔符均为单字符时，先统一为同一分隔符再用str.split分割
+    if delimiters and all(len(d) == 1 for d in delimiters):
+        parts = text.translate(_translate_table(delimiters)).split(
+            delimiters[0]
+        )
+    else:
+        parts = _compile(delimiters).split(text)
 
     # 分割并过滤空字符串
-    return [part.strip() for part in re.split(pattern, text) if part.strip()]
+    return [part for part in map(str.strip, parts) if part]
@@ -1,12 +1,42 @@
 import datetime
 import json
-import uuid
+import re
+import secrets
+from types import MappingProxyType
 from typing import Any, Optional
 
 import yaml
-from openapi_core import OpenAPI
+from openapi_core import Config, OpenAPI
 
 from api.mcp import Cors, HttpServer, Mcp, Router, Tool
+from myunla.utils import get_logger
+
+logger = get_logger(__name__)
+
+# 不生成工具的HTTP方法
+_SKIP_METHODS = frozenset({"options", "head", "trace"})
+# 请求体中由系统生成、无需用户传入的字段
+_SKIP_FIELDS = frozenset({"Id", "createdAt"})
+
+# 工具默认请求头，Tool校验时会复制为独立的dict
+_DEFAULT_HEADERS = MappingProxyType(
+    {
+        "Content-Type": "application/json",
+        "Authorization": "Bearer {{request.headers.Authorization}}",
+    }
+)
+
+# 路径中的参数占位符，如 /pets/{petId}
+_PATH_PARAM_RE = re.compile(r"\{([^{}]+)\}")
+
+# 跳过OpenAPI规范完整校验的配置，仍保留$ref解析
+_NO_VALIDATION_CONFIG = Config(spec_validator_cls=None)
+
+# 优先使用libyaml的C实现解析YAML，不可用时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 
 class OpenAPIConverter:
@@ -21,6 +51,7 @@ class OpenAPIConverter:
         self,
         oas_path: Optional[str] = None,
         oas_content: Optional[bytes] = None,
+        validate: bool = True,
     ):
         """
         初始化OpenAPI转换器
@@ -28,6 +59,7 @@ class OpenAPIConverter:
         Args:
             oas_path: OpenAPI规范文件路径（支持JSON和YAML格式）
             oas_content: OpenAPI规范文件内容（字节格式）
+            validate: 是否对OpenAPI规范做完整校验，关闭后仅解析不校验
 
         Raises:
             ValueError: 当oas_path和oas_content都未提供时
@@ -41,10 +73,13 @@ class OpenAPIConverter:
             raise ValueError("必须提供 oas_path 或 oas_content 参数")
 
         try:
-            self.spec = OpenAPI.from_dict(oas).spec
-        except Exception as e:
-            print(e)
-            raise e
+            config = None if validate else _NO_VALIDATION_CONFIG
+            self.spec = OpenAPI.from_dict(oas, config=config).spec
+        except Exception:
+            logger.exception(
+                "OpenAPI规范解析失败: %s", oas_path or "<oas_content>"
+            )
+            raise
 
     def _load_from_file(self, file_path: str) -> dict:
         """
@@ -56,11 +91,12 @@ class OpenAPIConverter:
         Returns:
             dict: 解析后的OpenAPI规范字典
         """
+        if file_path.endswith(".json"):
+            with open(file_path, "rb") as f:
+                return json.loads(f.read())
+        # 默认按YAML处理
         with open(file_path, "r", encoding="utf-8") as f:
-            if file_path.endswith(".json"):
-                return json.load(f)
-            else:  # 默认按YAML处理
-                return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
 
     def _load_from_content(self, content: bytes) -> dict:
         """
@@ -72,13 +108,14 @@ class OpenAPIConverter:
         Returns:
             dict: 解析后的OpenAPI规范字典
         """
-        text = content.decode("utf-8")
-        try:
-            # 尝试解析为JSON
-            return json.loads(text)
-        except json.JSONDecodeError:
-            # JSON解析失败，尝试YAML
-            return yaml.safe_load(text)
+        # 根据首个非空白字符判断格式，YAML内容无需先尝试JSON解析
+        if content.lstrip()[:1] in (b"{", b"["):
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                # YAML的flow风格也可能以{或[开头
+                pass
+        return yaml.load(content, Loader=_YamlLoader)
 
     def convert(self):
         """
@@ -90,12 +127,15 @@ class OpenAPIConverter:
             Mcp: 完整的MCP配置对象
         """
         rs = self._get_random_str()
+        now = datetime.datetime.now()
+        info = self.spec["info"]
+        servers = self.spec.get("servers") or ()
         # 创建基础MCP配置
         mcp_config = Mcp(
-            name=self.spec["info"]["title"].replace(" ", "_") + "_" + rs,
+            name=info["title"].replace(" ", "_") + "_" + rs,
             tenant_name="default",
-            updated_at=datetime.datetime.now(),
-            created_at=datetime.datetime.now(),
+            updated_at=now,
+            created_at=now,
             deleted_at=None,
             servers=[],
             routers=[],
@@ -106,10 +146,8 @@ class OpenAPIConverter:
         # 创建HTTP服务器配置
         server_config = HttpServer(
             name=mcp_config.name,
-            description=self.spec["info"]["description"],
-            url=len(self.spec["servers"]) > 0
-            and self.spec["servers"][0]["url"]
-            or "",
+            description=info["description"],
+            url=servers[0]["url"] if servers else "",
             tools=[],
         )
 
@@ -146,9 +184,9 @@ class OpenAPIConverter:
             length: 随机名称长度，默认为10
 
         Returns:
-            str: 基于UUID生成的随机字符串
+            str: 随机十六进制字符串
         """
-        return uuid.uuid4().hex[:length]
+        return secrets.token_hex((length + 1) // 2)[:length]
 
     def _get_tools(self, mcp_config: Mcp, server_config: HttpServer):
         """
@@ -160,32 +198,26 @@ class OpenAPIConverter:
             mcp_config: MCP配置对象，工具将添加到此对象中
             server_config: HTTP服务器配置对象
         """
+        schemas = self.spec.get("components", {}).get("schemas", {})
         for path, path_item in self.spec["paths"].items():
             for method, operation in path_item.items():
-                if method == "options":
+                if method in _SKIP_METHODS:
                     continue
 
                 # 生成操作ID（如果不存在）
-                if (
-                    "operationId" not in operation
-                    or operation["operationId"] == ""
-                ):
-                    pathparts = path.split("/")[1:]
-                    operation["operationId"] = (
-                        "_".join(pathparts) + "_" + method
-                    )
+                op_id = operation.get("operationId") or (
+                    path.lstrip("/").replace("/", "_") + "_" + method
+                )
 
                 # 创建工具定义
                 tool = Tool(
-                    name=operation["operationId"],
-                    description=operation["summary"]
-                    or operation["description"],
+                    name=op_id,
+                    description=operation.get("summary")
+                    or operation.get("description")
+                    or "",
                     method=method,
                     path="{{config.url}}" + path,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": "Bearer {{request.headers.Authorization}}",
-                    },
+                    headers=_DEFAULT_HEADERS,
                     args=[],
                     request_body="",
                     response_body="{{response.body}}",
@@ -197,36 +229,33 @@ class OpenAPIConverter:
                     operation, tool
                 )
                 # 解析请求体参数
-                body_params = self._get_request_body(
-                    self.spec.get("components", {}), operation, tool
-                )
-                tool.args = (
-                    query_params + header_params + path_params + body_params
-                )
+                body_params = self._get_request_body(schemas, operation, tool)
+                tool.args = [
+                    *query_params,
+                    *header_params,
+                    *path_params,
+                    *body_params,
+                ]
 
                 # 构建请求体模板
-                if len(body_params) > 0:
-                    s = "{\n"
-                    for i, _body in enumerate(body_params):
-                        s += '     {name}: {{{{ args.{name} | tojson }}}}'.format(
-                            name=_body["name"]
-                        )
-                        if i < len(body_params) - 1:
-                            s += ",\n"
-                    s += "\n}"
-                    tool.request_body = s
+                if body_params:
+                    lines = [
+                        f'     {b["name"]}: {{{{ args.{b["name"]} | tojson }}}}'
+                        for b in body_params
+                    ]
+                    tool.request_body = "{\n" + ",\n".join(lines) + "\n}"
 
                 mcp_config.tools.append(tool)
                 server_config.tools.append(tool.name)
 
-    def _get_request_body(self, components, operation: Any, tool: Tool) -> Any:
+    def _get_request_body(self, schemas, operation: Any, tool: Tool) -> Any:
         """
         解析OpenAPI操作的请求体参数
 
         从OpenAPI操作定义中提取请求体schema，并转换为MCP工具参数。
 
         Args:
-            components: OpenAPI规范的components部分，包含共享的schema定义
+            schemas: OpenAPI规范components中共享的schema定义
             operation: OpenAPI操作对象
             tool: MCP工具对象，用于设置请求体内容类型
 
@@ -234,11 +263,10 @@ class OpenAPIConverter:
             list: 请求体参数列表
         """
         body = []
-        if operation.get("requestBody"):
-            body_required = operation["requestBody"]["required"]
-            for content_type, media_type in operation["requestBody"][
-                "content"
-            ].items():
+        request_body = operation.get("requestBody")
+        if request_body:
+            body_required = request_body.get("required", False)
+            for content_type, media_type in request_body["content"].items():
                 if content_type != "application/json":
                     continue
                 tool.request_body = content_type
@@ -251,12 +279,8 @@ class OpenAPIConverter:
                     refname = schema["$ref"].removeprefix(
                         "#/components/schemas/"
                     )
-                    if (
-                        refname
-                        and "schemas" in components
-                        and refname in components["schemas"]
-                    ):
-                        schema = components["schemas"][refname]
+                    if refname and refname in schemas:
+                        schema = schemas[refname]
 
                 # 解析schema属性
                 props = schema.get("properties")
@@ -264,11 +288,7 @@ class OpenAPIConverter:
                     continue
                 for name, prop in props.items():
                     # 跳过系统生成的字段
-                    if (
-                        name.endswith("response")
-                        or name == "Id"
-                        or name == "createdAt"
-                    ):
+                    if name in _SKIP_FIELDS or name.endswith("response"):
                         continue
                     arg = {
                         "name": name,
@@ -312,10 +332,12 @@ class OpenAPIConverter:
         query_params = []
         header_params = []
         path_params = []
-        if "parameters" not in operatons:
+        params = operatons.get("parameters")
+        if not params:
             return query_params, header_params, path_params
 
-        for param in operatons["parameters"]:
+        path_subs: dict[str, str] = {}
+        for param in params:
             arg = {
                 "name": param["name"],
                 "position": param["in"],
@@ -342,11 +364,13 @@ class OpenAPIConverter:
                 elif _in == "path":
                     arg["required"] = True
                     path_params.append(arg)
-                    # 替换路径中的参数占位符
-                    tool.path = tool.path.replace(
-                        "{" + arg["name"] + "}",
-                        "{{args." + arg["name"] + "}}",
-                    )
+                    path_subs[arg["name"]] = "{{args." + arg["name"] + "}}"
+
+        # 一次遍历替换路径中的所有参数占位符
+        if path_subs:
+            tool.path = _PATH_PARAM_RE.sub(
+                lambda m: path_subs.get(m.group(1), m.group(0)), tool.path
+            )
 
         return query_params, header_params, path_params
 
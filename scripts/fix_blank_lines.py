@@ -7,11 +7,26 @@ W293: 空行包含空白字符
 """
 
 import argparse
+import multiprocessing
 import os
 import re
 from pathlib import Path
 from typing import Optional
 
+# 进程池每批分发的文件数；不足两批时串行处理，避免启动进程池的开销
+_CHUNKSIZE = 32
+
+# 只包含空白字符的行（兼容CRLF换行），直接在字节上匹配，空白检测与编码无关
+_W293_RE = re.compile(rb'^[ \t]+(?=\r?$)', re.MULTILINE)
+
+
+def _has_w293(data: bytes) -> bool:
+    """逐行检查是否存在只包含空白字符的行，比逐行锚定的正则匹配更快"""
+    for line in data.split(b'\n'):
+        if line and line != b'\r' and not line.strip(b' \t\r'):
+            return True
+    return False
+
 
 def fix_blank_lines_in_file(file_path: Path) -> bool:
     """
@@ -24,17 +39,22 @@ def fix_blank_lines_in_file(file_path: Path) -> bool:
         bool: 如果文件被修改则返回True
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        if os.stat(file_path).st_size == 0:
+            return False
+
+        with open(file_path, 'rb') as f:
             content = f.read()
 
-        # 使用正则表达式匹配只包含空白字符的行
-        # 将这些行替换为空行
-        original_content = content
-        fixed_content = re.sub(r'^[ \t]+$', '', content, flags=re.MULTILINE)
+        # 大多数文件无需修复，先用快速扫描跳过正则替换
+        if not _has_w293(content):
+            return False
+
+        # 将只包含空白字符的行替换为空行
+        fixed_content = _W293_RE.sub(b'', content)
 
         # 检查是否有变化
-        if original_content != fixed_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
+        if content != fixed_content:
+            with open(file_path, 'wb') as f:
                 f.write(fixed_content)
             return True
 
@@ -45,6 +65,28 @@ def fix_blank_lines_in_file(file_path: Path) -> bool:
         return False
 
 
+def has_blank_line_whitespace(file_path: Path) -> bool:
+    """
+    检查文件中是否存在包含空白字符的空行
+
+    Args:
+        file_path: 要检查的文件路径
+
+    Returns:
+        bool: 如果文件需要修复则返回True
+    """
+    try:
+        if os.stat(file_path).st_size == 0:
+            return False
+
+        with open(file_path, 'rb') as f:
+            return _has_w293(f.read())
+
+    except OSError as e:
+        print(f"处理文件 {file_path} 时出错: {e}")
+        return False
+
+
 def find_python_files(
     directory: Path, exclude_patterns: Optional[list[str]] = None
 ) -> list[Path]:
@@ -53,7 +95,7 @@ def find_python_files(
 
     Args:
         directory: 要搜索的目录
-        exclude_patterns: 要排除的目录模式列表
+        exclude_patterns: 要排除的目录名列表
 
     Returns:
         Python文件路径列表
@@ -68,14 +110,12 @@ def find_python_files(
             'node_modules',
         ]
 
+    exclude_set = frozenset(exclude_patterns)
+
     python_files = []
     for root, dirs, files in os.walk(directory):
-        # 排除指定的目录
-        dirs[:] = [
-            d
-            for d in dirs
-            if not any(pattern in d for pattern in exclude_patterns)
-        ]
+        # 排除指定的目录（按目录名精确匹配）
+        dirs[:] = [d for d in dirs if d not in exclude_set]
 
         for file in files:
             if file.endswith('.py'):
@@ -84,6 +124,25 @@ def find_python_files(
     return python_files
 
 
+def _iter_results(worker, files: list[Path]):
+    """
+    按文件顺序逐个产出处理结果
+
+    文件较少时串行处理；否则各文件相互独立，使用进程池并行处理，
+    imap保持结果与文件顺序一致。
+
+    Args:
+        worker: 处理单个文件的函数
+        files: 要处理的文件列表
+    """
+    if len(files) < 2 * _CHUNKSIZE:
+        yield from map(worker, files)
+        return
+
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        yield from pool.imap(worker, files, chunksize=_CHUNKSIZE)
+
+
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(
@@ -101,7 +160,7 @@ def main():
         help='仅显示需要修复的文件，不实际修改',
     )
     parser.add_argument(
-        '--exclude', action='append', default=[], help='要排除的目录模式'
+        '--exclude', action='append', default=[], help='要排除的目录名'
     )
     parser.add_argument(
         '--verbose', '-v', action='store_true', help='显示详细输出'
@@ -142,21 +201,19 @@ def main():
 
     print(f"开始处理 {total_count} 个Python文件...")
 
-    for file_path in files_to_process:
+    # 干运行模式：检查但不修改；否则实际修复
+    worker = (
+        has_blank_line_whitespace if args.dry_run else fix_blank_lines_in_file
+    )
+    results = _iter_results(worker, files_to_process)
+    for file_path, matched in zip(files_to_process, results):
+        if not matched:
+            continue
+        fixed_count += 1
         if args.dry_run:
-            # 干运行模式：检查但不修改
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            if re.search(r'^[ \t]+$', content, flags=re.MULTILINE):
-                print(f"需要修复: {file_path}")
-                fixed_count += 1
-        else:
-            # 实际修复模式
-            if fix_blank_lines_in_file(file_path):
-                fixed_count += 1
-                if args.verbose:
-                    print(f"已修复: {file_path}")
+            print(f"需要修复: {file_path}")
+        elif args.verbose:
+            print(f"已修复: {file_path}")
 
     if args.dry_run:
         print(f"\n干运行完成: 发现 {fixed_count} 个文件需要修复")
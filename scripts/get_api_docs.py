@@ -6,6 +6,12 @@ from fastapi.openapi.utils import get_openapi
 
 from myunla.app import app
 
+# 优先使用libyaml的C实现输出YAML，不可用时回退到纯Python实现
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 
 def dump_api_docs(app: FastAPI, path: str):
     openapi_schema = get_openapi(
@@ -16,7 +22,11 @@ def dump_api_docs(app: FastAPI, path: str):
     )
     with open(path, "w", encoding="utf-8") as f:
         yaml.dump(
-            openapi_schema, f, allow_unicode=True, default_flow_style=False
+            openapi_schema,
+            f,
+            Dumper=_YamlDumper,
+            allow_unicode=True,
+            default_flow_style=False,
         )
 
 
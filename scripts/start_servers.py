@@ -6,6 +6,7 @@
 
 import multiprocessing
 import os
+import socket
 import sys
 import time
 
@@ -116,6 +117,25 @@ def start_gateway_server(
         print("🌐 Gateway服务器已停止")
 
 
+def wait_for_port(
+    host: str,
+    port: int,
+    process: multiprocessing.Process,
+    timeout: float = 30.0,
+) -> bool:
+    """等待服务器端口可连接，进程提前退出或超时则返回False"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not process.is_alive():
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
 def main():
     """主函数"""
     # 不注册信号处理器，让子进程自己处理信号
@@ -161,11 +181,14 @@ def main():
         # 启动进程
         print("🔄 正在启动API服务器...")
         api_process.start()
-        time.sleep(2)  # 等待API服务器启动
+        # 等待API服务器开始监听，再启动依赖其初始化数据的Gateway
+        if not wait_for_port(api_host, api_port, api_process):
+            print("⚠️  API服务器未能就绪，继续启动Gateway服务器...")
 
         print("🔄 正在启动Gateway服务器...")
         gateway_process.start()
-        time.sleep(1)  # 等待Gateway服务器启动
+        if not wait_for_port(gateway_host, gateway_port, gateway_process):
+            print("⚠️  Gateway服务器未能就绪")
 
         print("✅ 所有服务器已启动!")
         print("📋 使用 Ctrl+C 来停止所有服务器")